@@ -1,21 +1,28 @@
 #!/usr/bin/env python3
 
+import re
 from abc import ABC, abstractmethod
+from array import array
 from typing import Any, List, Dict, Union, Optional
 
+LOG_TYPE_RE = re.compile(r"[A-Z]+")
+INT_TYPECODES = "bBhHiIlLqQ"
+
 
 class DataProcessor(ABC):
     '''
     Base abstract class for processors
     '''
 
+    __slots__ = ('data',)
+
     def __init__(self, data: Optional[Any]) -> None:
         self.data = data
 
     @abstractmethod
-    def process(self, data: Any) -> str:
+    def process(self, data: Any, validated: bool = False) -> str:
         '''
-        Process and analyse data
+        Process and analyse data, skipping validation if already done
         '''
         pass
 
@@ -39,20 +46,27 @@ class NumericProcessor(DataProcessor):
     Simulate a numeric processor
     '''
 
+    __slots__ = ()
+
     def __init__(self, data: Optional[List[Union[int, str]]] = None) -> None:
         super().__init__(data)
 
-    def process(self, data: Any) -> str:
-        if not self.validate(data):
+    def process(self, data: Any, validated: bool = False) -> str:
+        if not validated and not self.validate(data):
             return "Validation ERROR"
 
-        s = 0
+        s = sum(data)
         d_len = len(data)
-        for num in data:
-            s += num
         return f"Processed {d_len} numeric values, sum={s}, avg={s / d_len}"
 
     def validate(self, data: Any) -> bool:
+        if isinstance(data, range):
+            return True
+        if isinstance(data, array) and data.typecode in INT_TYPECODES:
+            return True
+        if {int}.issuperset(map(type, data)):
+            return True
+
         for elem in data:
             try:
                 if int(elem) != elem:
@@ -62,7 +76,7 @@ class NumericProcessor(DataProcessor):
         return True
 
     def format_output(self, result: str) -> str:
-        return "Output: " + result
+        return f"Output: {result}"
 
 
 class TextProcessor(DataProcessor):
@@ -70,43 +84,33 @@ class TextProcessor(DataProcessor):
     Simulate a text processor
     '''
 
+    __slots__ = ()
+
     def __init__(self, data: Optional[List[Union[int, str]]] = None):
         super().__init__(data)
 
-    def process(self, data: Any) -> str:
-        if not self.validate(data):
+    def process(self, data: Any, validated: bool = False) -> str:
+        if not validated and not self.validate(data):
             return "Validation ERROR"
 
-        c, w = 0, 0
-        for k in range(len(data)):
-            if data[k].isalpha():
-                c += 1
-                if k == len(data) - 1 or data[k + 1] == " ":
-                    w += 1
+        c = sum(map(str.isalpha, data))
+        w = len(data.split())
 
         return f"Processed text: {c} characters, {w} words"
 
     def validate(self, data: Any) -> bool:
-        for elem in data:
-            try:
-                if str(elem) != elem:
-                    return False
-            except ValueError:
-                return False
-        return True
+        return isinstance(data, str) and bool(data)
 
     def format_output(self, result: str) -> str:
-        return "Output: " + result
+        return f"Output: {result}"
 
 
 def get_type_index(data: str) -> int:
     '''
     Return the index of the end of the log processor type in the string data
     '''
-    i = 1
-    while data[i].isupper():
-        i += 1
-    return i
+    match = LOG_TYPE_RE.match(data)
+    return match.end() if match else 0
 
 
 class LogProcessor(DataProcessor):
@@ -114,11 +118,13 @@ class LogProcessor(DataProcessor):
     Simulate a log processor
     '''
 
+    __slots__ = ()
+
     def __init__(self, data: Optional[List[Union[int, str]]] = None):
         super().__init__(data)
 
-    def process(self, data: Any) -> str:
-        if not self.validate(data):
+    def process(self, data: Any, validated: bool = False) -> str:
+        if not validated and not self.validate(data):
             return "Validation ERROR"
 
         ind = get_type_index(data)
@@ -127,19 +133,13 @@ class LogProcessor(DataProcessor):
         if r_type == "ERROR":
             r_type = "ALERT"
 
-        return f"[{r_type}] {data[0:ind]} level detected: " + data[ind + 2:]
+        return f"[{r_type}] {data[0:ind]} level detected: {data[ind + 2:]}"
 
     def validate(self, data: Any) -> bool:
-        for elem in data:
-            try:
-                if str(elem) != elem:
-                    return False
-            except ValueError:
-                return False
-        return True
+        return isinstance(data, str) and bool(data)
 
     def format_output(self, result: str) -> str:
-        return "Output: " + result
+        return f"Output: {result}"
 
 
 def test_numeric(datas: Dict) -> None:
@@ -154,7 +154,7 @@ def test_numeric(datas: Dict) -> None:
     if obj.validate(data):
         print("Validation: Numeric data verified")
 
-        result = obj.process(data)
+        result = obj.process(data, validated=True)
         print(obj.format_output(result))
     else:
         print("Validation: Error")
@@ -174,7 +174,7 @@ def test_text(datas: Dict) -> None:
     if obj.validate(data):
         print("Validation: Text data verified")
 
-        result = obj.process(data)
+        result = obj.process(data, validated=True)
         print(obj.format_output(result))
     else:
         print("Validation: Error")
@@ -194,7 +194,7 @@ def test_log(datas: Dict) -> None:
     if obj.validate(data):
         print("Validation: Log entry verified")
 
-        result = obj.process(data)
+        result = obj.process(data, validated=True)
         print(obj.format_output(result))
     else:
         print("Validation: Error")
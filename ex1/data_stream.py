@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 from abc import ABC, abstractmethod
+from statistics import fmean
 from typing import Any, List, Dict, Union, Optional
 
 
@@ -9,6 +10,10 @@ class DataStream(ABC):
     Base abstract class for streams
     '''
 
+    __slots__ = ('stream_id', 'nb_processed')
+    STREAM_TYPE: str
+    PROCESS_TYPE: str
+
     def __init__(self, stream_id: str) -> None:
         self.stream_id = stream_id
         self.nb_processed = 0
@@ -47,7 +52,7 @@ class DataStream(ABC):
         '''
         Return some information about the stream
         '''
-        return f"Stream ID: {self.stream_id}, Type: " + stream_type
+        return f"Stream ID: {self.stream_id}, Type: {stream_type}"
 
 
 class SensorStream(DataStream):
@@ -55,28 +60,34 @@ class SensorStream(DataStream):
     Simulate a sensor stream
     '''
 
+    __slots__ = ()
+    STREAM_TYPE = "Sensor"
+    PROCESS_TYPE = "readings"
+
     def process_batch(self, data_batch: List[Any]) -> str:
-        res = "["
-        start, end = "{", "}"
         if len(data_batch) == 1:
-            start, end = "", ""
-
-        for k in range(len(data_batch)):
-            res += start
-            for (cle, val) in data_batch[k].items():
-                self.nb_processed += 1
-                res += cle + ": " + str(val) + ", "
-            res = res[:-2]
-            res += end
+            return self._process_one(data_batch[0])
+        return self._process_many(data_batch)
 
-            if k != len(data_batch) - 1:
-                res += ", "
-        res += "]"
+    def _process_one(self, reading: Dict[str, Any]) -> str:
+        '''
+        Process a batch made of a single reading
+        '''
+        self.nb_processed += len(reading)
+        body = ", ".join(f"{cle}: {val}" for (cle, val) in reading.items())
+        return f"[{body}]"
 
-        if len(data_batch) != 1:
-            self.nb_processed = len(data_batch)
+    def _process_many(self, data_batch: List[Any]) -> str:
+        '''
+        Process a batch of several readings
+        '''
+        items = []
+        for item in data_batch:
+            body = ", ".join(f"{cle}: {val}" for (cle, val) in item.items())
+            items.append("{" + body + "}")
 
-        return res
+        self.nb_processed = len(data_batch)
+        return "[" + ", ".join(items) + "]"
 
     def filter_data(self, data_batch: List[Any],
                     criteria: Optional[str] = None) -> List[Any]:
@@ -86,18 +97,8 @@ class SensorStream(DataStream):
         return new_batch
 
     def get_analysis(self, new_batch: List[Any]) -> str:
-        res = ""
-        res += str(self.nb_processed) + " readings processed,"
-
-        total = 0
-        nb_temp = 0
-        for batch in new_batch:
-            total += batch["temp"]
-            nb_temp += 1
-
-        res += f" avg temp: {total / nb_temp}°C"
-
-        return res
+        avg = fmean(batch["temp"] for batch in new_batch)
+        return f"{self.nb_processed} readings processed, avg temp: {avg}°C"
 
 
 class TransactionStream(DataStream):
@@ -105,49 +106,32 @@ class TransactionStream(DataStream):
     Simulate a transaction stream
     '''
 
-    def process_batch(self, data_batch: List[Any]) -> str:
-        res = "["
+    __slots__ = ()
+    STREAM_TYPE = "Transaction"
+    PROCESS_TYPE = "operations"
 
-        for k in range(len(data_batch)):
-            for (cle, val) in data_batch[k].items():
-                self.nb_processed += 1
-                res += cle + ": " + str(val) + ", "
-            res = res[:-2]
-
-            if k != len(data_batch) - 1:
-                res += ", "
-        res += "]"
+    def process_batch(self, data_batch: List[Any]) -> str:
+        self.nb_processed += sum(map(len, data_batch))
+        items = [", ".join(f"{cle}: {val}" for (cle, val) in item.items())
+                 for item in data_batch]
 
-        return res
+        return "[" + ", ".join(items) + "]"
 
     def filter_data(self, data_batch: List[Any],
                     criteria: Optional[str] = None) -> List[Any]:
         new_batch = data_batch
-        index = []
-        for batch in data_batch:
-            index.append(list(batch.keys())[0])
-
         if criteria == "large_transaction":
-            new_batch = [data_batch[k] for k in range(len(data_batch))
-                         if data_batch[k][index[k]] > 25]
+            new_batch = [batch for batch in data_batch
+                         if next(iter(batch.values())) > 25]
         return new_batch
 
     def get_analysis(self, new_batch: List[Any]) -> str:
-        res = ""
-        res += str(self.nb_processed) + " operations,"
-
-        net = 0
-        for batch in new_batch:
-            batch_type = list(batch.keys())[0]
-            if batch_type == "buy":
-                net += batch[batch_type]
-            else:
-                net -= batch[batch_type]
+        pairs = (next(iter(batch.items())) for batch in new_batch)
+        net = sum(amount if batch_type == "buy" else -amount
+                  for (batch_type, amount) in pairs)
 
         sign = '+' if net >= 0 else ''
-        res += " net flow: " + sign + str(net) + " units"
-
-        return res
+        return f"{self.nb_processed} operations, net flow: {sign}{net} units"
 
 
 class EventStream(DataStream):
@@ -155,6 +139,10 @@ class EventStream(DataStream):
     Simulate an event stream
     '''
 
+    __slots__ = ()
+    STREAM_TYPE = "Event"
+    PROCESS_TYPE = "events"
+
     def process_batch(self, data_batch: List[Any]) -> str:
         self.nb_processed += len(data_batch)
         return str(data_batch)
@@ -167,18 +155,10 @@ class EventStream(DataStream):
         return new_batch
 
     def get_analysis(self, new_batch: List[Any]) -> str:
-        res = ""
-        res += str(self.nb_processed) + " events,"
-
-        nb_error = 0
-        for batch in new_batch:
-            if batch == "error":
-                nb_error += 1
-
+        nb_error = new_batch.count("error")
         plurial = "s" if nb_error > 1 else ""
-        res += f" {nb_error} error" + plurial + " detected"
-
-        return res
+        return (f"{self.nb_processed} events, "
+                f"{nb_error} error{plurial} detected")
 
 
 class StreamProcessor:
@@ -205,20 +185,10 @@ class StreamProcessor:
             filter_batch = stream.filter_data(batches[stream.stream_id])
             stream.process_batch(filter_batch)
 
-            if isinstance(stream, SensorStream):
-                stream_type = "Sensor"
-                process_type = "readings"
-            elif isinstance(stream, TransactionStream):
-                stream_type = "Transaction"
-                process_type = "operations"
-            elif isinstance(stream, EventStream):
-                stream_type = "Event"
-                process_type = "events"
-
             stats = stream.get_stats()
 
-            print(f"- {stream_type} data: " + str(stats["nb_processed"]) +
-                  f" {process_type} processed")
+            print(f"- {stream.STREAM_TYPE} data: {stats['nb_processed']} "
+                  f"{stream.PROCESS_TYPE} processed")
 
         print()
 
@@ -1,7 +1,73 @@
 #!/usr/bin/env python3
 
-from abc import ABC, abstractmethod
-from typing import Any, List, Dict, Union, Optional, Protocol
+import atexit
+import os
+import sys
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType, MethodType
+from typing import (
+    Any, Callable, Deque, List, Dict, Mapping, Tuple, Optional, Protocol
+)
+
+HISTORY_SIZE = 10_000
+CSV_OUTPUT = "Output: User activity logged: 1 actions processed"
+STREAM_OUTPUT = "Output: Stream summary: 5 readings, avg: 22.1°C"
+LOG_QUIET = os.environ.get("NEXUS_QUIET") == "1"
+_log_local = threading.local()
+_log_lock = threading.Lock()
+
+
+def log_lines() -> List[str]:
+    '''
+    Return the log buffer of the current thread
+    '''
+    lines = getattr(_log_local, "lines", None)
+    if lines is None:
+        lines = _log_local.lines = []
+    return lines
+
+
+def log(message: str, *args: Any) -> None:
+    '''
+    Queue a line for stdout, written on the next flush_log()
+
+    The message is %-formatted with args only when logging is enabled
+    '''
+    if not LOG_QUIET:
+        log_lines().append(message % args if args else message)
+
+
+def flush_log() -> None:
+    '''
+    Write the lines queued by the current thread to stdout in one call
+    '''
+    lines = getattr(_log_local, "lines", None)
+    if lines:
+        text = "\n".join(lines) + "\n"
+        lines.clear()
+        with _log_lock:
+            sys.stdout.write(text)
+
+
+atexit.register(flush_log)
+
+KINDS = range(4)
+KIND_DICT, KIND_CSV, KIND_TEXT, KIND_OTHER = KINDS
+MISSING = object()
+
+
+def classify(data: Any) -> int:
+    '''
+    Return the kind of the data: dict, CSV string, plain string or other
+    '''
+    if isinstance(data, dict):
+        return KIND_DICT
+    if isinstance(data, str):
+        return KIND_CSV if "," in data else KIND_TEXT
+    return KIND_OTHER
 
 
 class ProcessingStage(Protocol):
@@ -12,178 +78,421 @@ class ProcessingStage(Protocol):
         pass
 
 
-class ProcessingPipeline(ABC):
+class ProcessingPipeline:
+    __slots__ = (
+        'stages', 'stats', 'stats_view', 'lock', 'fused', 'batch_steps',
+        'sealed'
+    )
+
     def __init__(self) -> None:
         self.stages: List[ProcessingStage] = []
         self.stats: Dict[str, Any] = {'success': 0, 'errors': 0}
+        self.stats_view: Mapping[str, Any] = MappingProxyType(self.stats)
+        self.lock = threading.Lock()
+        self.fused: Optional[Callable[[Any], Any]] = None
+        self.batch_steps: Tuple[Callable[[List[Any]], List[Any]], ...] = ()
+        self.sealed = False
 
     def add_stage(self, stage: ProcessingStage) -> None:
+        if self.sealed:
+            raise RuntimeError("cannot add a stage to a sealed pipeline")
         self.stages.append(stage)
+        self.fused = None
+
+    def seal(self) -> None:
+        '''
+        Freeze the stages and compile them, done on the first execution
+        '''
+        self.sealed = True
+        self.compile()
+
+    def update_stats(self, success: int, errors: int) -> None:
+        '''
+        Add to the pipeline counters
+        '''
+        with self.lock:
+            self.stats['success'] += success
+            self.stats['errors'] += errors
+
+    def active_stages(self) -> List[ProcessingStage]:
+        '''
+        Return the stages doing work, dropping log-only ones when quiet
+        '''
+        if not LOG_QUIET:
+            return self.stages
+        return [stage for stage in self.stages
+                if not getattr(stage, "LOG_ONLY", False)]
+
+    def compile(self) -> Callable[[Any], Any]:
+        '''
+        Fuse the stages into a single callable and its batch counterpart
+
+        Consecutive DispatchStages become one step classifying the data once
+        '''
+        steps = []
+        batch_steps = []
+        for group in group_stages(self.active_stages()):
+            if isinstance(group, tuple):
+                step = dispatch_step(group)
+                batch_steps.append(map_step(step))
+            else:
+                step = group.process
+                batch_steps.append(
+                    getattr(group, "process_batch", None) or map_step(step)
+                )
+            steps.append(step)
+
+        if len(steps) == 1:
+            fused = steps[0]
+        else:
+            def fused(data: Any) -> Any:
+                for step in steps:
+                    data = step(data)
+                return data
+
+        self.batch_steps = tuple(batch_steps)
+        self.fused = fused
+        return fused
 
-    @abstractmethod
     def process(self, data: Any) -> Any:
         '''
         Process all the stages in self.stages
         '''
-        pass
+        fused = self.fused or self.compile()
+        try:
+            return fused(data)
+        finally:
+            flush_log()
+
+    def run(self, data: Any) -> Tuple[Optional[Any], bool]:
+        '''
+        Process the data handling error cases, without counting it
+
+        Return the result and whether the processing succeeded
+        '''
+        if not self.sealed:
+            self.seal()
+        try:
+            return self.process(data), True
+        except Exception as e:
+            print(f"Pipeline error: {e}")
+            return None, False
 
     def execute(self, data: Any) -> Optional[Any]:
         '''
         Execute the pipeline handling error cases
         '''
+        result, success = self.run(data)
+        self.update_stats(int(success), int(not success))
+        return result
+
+    def process_batch(self, batch: List[Any]) -> List[Any]:
+        '''
+        Run each stage over the whole batch before the next one
+        '''
+        if self.fused is None:
+            self.compile()
+        try:
+            for batch_step in self.batch_steps:
+                batch = batch_step(batch)
+            return batch
+        finally:
+            flush_log()
+
+    def execute_batch(self, batch: List[Any]) -> Optional[List[Any]]:
+        '''
+        Execute the pipeline on a batch handling error cases
+        '''
+        if not self.sealed:
+            self.seal()
         try:
-            result = self.process(data)
-            self.stats['success'] += 1
-            return result
+            results = self.process_batch(batch)
+            self.update_stats(len(batch), 0)
+            return results
         except Exception as e:
-            self.stats['errors'] += 1
+            self.update_stats(0, len(batch))
             print(f"Pipeline error: {e}")
             return None
 
-    def get_stats(self) -> Dict[str, Any]:
+    def get_stats(self) -> Mapping[str, Any]:
         '''
-        Return the pipeline stats
+        Return a live read-only view of the pipeline stats
         '''
-        return dict(self.stats)
+        return self.stats_view
 
 
-class InputStage:
+class DispatchStage:
     '''
-    Input stage for handling and validate the inputs
+    Base stage picking its handler from the kind of the data
+
+    Log-only stages must return the data they get, unchanged
     '''
-    def __init__(self) -> None:
-        pass
+    __slots__ = ()
+    LOG_ONLY = False
+    HANDLERS: Tuple[Callable[[Any, Any], Any], ...] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        '''
+        Build the table of handlers indexed by kind for each stage class
+        '''
+        super().__init_subclass__(**kwargs)
+        cls.HANDLERS = (cls._on_dict, cls._on_csv, cls._on_text, cls._on_other)
 
     def process(self, data: Any) -> Any:
         '''
-        Process the inputs data
+        Process the data with the handler matching its kind
         '''
-        if isinstance(data, dict):
-            print(f"Input: {data}")
-            return data
-        elif isinstance(data, str) and "," in data:
-            print(f'Input: "{data}"')
-            return data
-        elif isinstance(data, str):
-            print(f"Input: {data}")
-            return data
+        try:
+            return self.HANDLERS[classify(data)](self, data)
+        finally:
+            flush_log()
+
+    def process_batch(self, batch: List[Any]) -> List[Any]:
+        '''
+        Process every data of the batch without a process call per data
+        '''
+        handlers = self.HANDLERS
+        try:
+            return [handlers[classify(data)](self, data) for data in batch]
+        finally:
+            flush_log()
+
+    def _on_dict(self, data: Any) -> Any:
+        return data
+
+    def _on_csv(self, data: Any) -> Any:
+        return data
+
+    def _on_text(self, data: Any) -> Any:
+        return data
+
+    def _on_other(self, data: Any) -> Any:
         return data
 
 
-class TransformStage:
+DispatchStage.HANDLERS = (
+    DispatchStage._on_dict, DispatchStage._on_csv, DispatchStage._on_text,
+    DispatchStage._on_other
+)
+
+Handlers = Tuple[Callable[[Any], Any], ...]
+
+
+def handler_table(stages: List[DispatchStage]) -> Tuple[Handlers, ...]:
     '''
-    Transform stage for analyse and transform the data
+    Return, for each kind, the handlers of the stages bound in order
     '''
-    def __init__(self) -> None:
-        pass
+    return tuple(
+        tuple(MethodType(stage.HANDLERS[kind], stage) for stage in stages)
+        for kind in KINDS
+    )
 
-    def process(self, data: Any) -> Any:
-        '''
-        Transform data
-        '''
-        if isinstance(data, dict):
-            print("Transform: Enriched with metadata and validation")
-            return data
-        elif isinstance(data, str) and "," in data:
-            print("Transform: Parsed and structured data")
-            return data
-        elif isinstance(data, str):
-            print("Transform: Aggregated and filtered")
+
+def group_stages(stages: List[ProcessingStage]) -> List[Any]:
+    '''
+    Merge each run of DispatchStages into a table of handlers per kind
+
+    A run ends after a stage that is not log-only, as its output may be
+    of another kind than its input
+    '''
+    groups: List[Any] = []
+    run: List[DispatchStage] = []
+    for stage in stages:
+        dispatch = isinstance(stage, DispatchStage)
+        if dispatch:
+            run.append(stage)
+            if stage.LOG_ONLY:
+                continue
+        if run:
+            groups.append(handler_table(run))
+            run = []
+        if not dispatch:
+            groups.append(stage)
+    if run:
+        groups.append(handler_table(run))
+    return groups
+
+
+def dispatch_step(table: Tuple[Handlers, ...]) -> Callable[[Any], Any]:
+    '''
+    Return a step classifying the data once and running its kind handlers
+    '''
+    if len(table[0]) == 3:
+        def step(data: Any) -> Any:
+            first, second, third = table[classify(data)]
+            return third(second(first(data)))
+    else:
+        def step(data: Any) -> Any:
+            for handler in table[classify(data)]:
+                data = handler(data)
             return data
+
+    return step
+
+
+def map_step(step: Callable[[Any], Any]) -> Callable[[List[Any]], List[Any]]:
+    '''
+    Return a batch step running a step on each data of the batch
+    '''
+    def batch_step(batch: List[Any]) -> List[Any]:
+        return list(map(step, batch))
+
+    return batch_step
+
+
+class InputStage(DispatchStage):
+    '''
+    Input stage for handling and validate the inputs
+    '''
+    __slots__ = ()
+    LOG_ONLY = True
+
+    def _on_dict(self, data: Any) -> Any:
+        log("Input: %s", data)
         return data
 
+    def _on_csv(self, data: Any) -> Any:
+        log('Input: "%s"', data)
+        return data
+
+    def _on_text(self, data: Any) -> Any:
+        log("Input: %s", data)
+        return data
 
-class OutputStage:
+
+class TransformStage(DispatchStage):
     '''
-    Output stage for format the data
+    Transform stage for analyse and transform the data
     '''
-    def __init__(self) -> None:
-        pass
+    __slots__ = ()
+    LOG_ONLY = True
 
-    def process(self, data: Any) -> str:
-        '''
-        Format the output data
-        '''
-        if isinstance(data, dict):
-            if "sensor" in data and "value" in data:
-                value = data["value"]
-                unit = data.get("unit", "")
-                output = "Output: Processed temperature reading: "
-                output += f"{value}°{unit} (Normal range)"
-                print(output)
-                return output
-        elif isinstance(data, str) and "," in data:
-            output = "Output: User activity logged: 1 actions processed"
-            print(output)
-            return output
-        elif isinstance(data, str):
-            output = "Output: Stream summary: 5 readings, avg: 22.1°C"
-            print(output)
-            return output
-        return str(data)
+    def _on_dict(self, data: Any) -> Any:
+        log("Transform: Enriched with metadata and validation")
+        return data
+
+    def _on_csv(self, data: Any) -> Any:
+        log("Transform: Parsed and structured data")
+        return data
+
+    def _on_text(self, data: Any) -> Any:
+        log("Transform: Aggregated and filtered")
+        return data
 
 
-class JSONAdapter(ProcessingPipeline):
+def format_reading(value: Any, unit: Any) -> str:
     '''
-    Adaptator for the JSON data treatment
+    Format a temperature reading
     '''
-    def __init__(self, pipeline_id: str) -> None:
-        super().__init__()
-        self.pipeline_id = pipeline_id
+    return ("Output: Processed temperature reading: "
+            f"{value}°{unit} (Normal range)")
 
-    def process(self, data: Any) -> Union[str, Any]:
-        '''
-        Analyse the JSON data
-        '''
-        result = data
-        for stage in self.stages:
-            result = stage.process(result)
-        return result
+
+cached_reading = lru_cache(maxsize=4096, typed=True)(format_reading)
 
 
-class CSVAdapter(ProcessingPipeline):
+def reading_output(value: Any, unit: Any) -> str:
     '''
-    Adaptator for the CSV data treatment
+    Format a reading, through the cache only when equal values print alike
+
+    Equal ints or strings always print the same, and so do equal non-zero
+    floats, but 0.0 and -0.0 or Decimal("1.0") and Decimal("1.00") do not
     '''
-    def __init__(self, pipeline_id: str) -> None:
-        super().__init__()
-        self.pipeline_id = pipeline_id
+    value_type = type(value)
+    if type(unit) is str and (
+        value_type is int or value_type is str
+        or (value_type is float and value != 0.0)
+    ):
+        return cached_reading(value, unit)
+    return format_reading(value, unit)
 
-    def process(self, data: Any) -> Union[str, Any]:
-        '''
-        Analyse the CSV data
-        '''
-        result = data
-        for stage in self.stages:
-            result = stage.process(result)
-        return result
 
+class OutputStage(DispatchStage):
+    '''
+    Output stage for format the data
+    '''
+    __slots__ = ()
+
+    def _on_dict(self, data: Any) -> str:
+        value = data.get("value", MISSING)
+        if value is MISSING or "sensor" not in data:
+            return str(data)
+
+        unit = data.get("unit", "")
+        output = reading_output(value, unit)
+        log(output)
+        return output
 
-class StreamAdapter(ProcessingPipeline):
+    def _on_csv(self, data: Any) -> str:
+        log(CSV_OUTPUT)
+        return CSV_OUTPUT
+
+    def _on_text(self, data: Any) -> str:
+        log(STREAM_OUTPUT)
+        return STREAM_OUTPUT
+
+    def _on_other(self, data: Any) -> str:
+        return str(data)
+
+
+class GenericAdapter(ProcessingPipeline):
     '''
-    Adaptator for the Stream data treatment
+    Adaptator for any data format, the stages handle each format
     '''
+    __slots__ = ('pipeline_id',)
+
     def __init__(self, pipeline_id: str) -> None:
         super().__init__()
         self.pipeline_id = pipeline_id
 
-    def process(self, data: Any) -> Union[str, Any]:
-        '''
-        Analyse the Stream data
-        '''
-        result = data
-        for stage in self.stages:
-            result = stage.process(result)
-        return result
+
+JSONAdapter = CSVAdapter = StreamAdapter = GenericAdapter
+
+
+Runner = Callable[[Any], Tuple[Optional[Any], bool]]
 
 
 class NexusManager:
     '''
     Manager of many different pipelines
     '''
+    __slots__ = (
+        'pipelines', 'executors', 'chains', 'history_names', 'history_data',
+        'history_results', 'lock', 'pool'
+    )
+
     def __init__(self) -> None:
         self.pipelines: Dict[str, ProcessingPipeline] = {}
-        self.execution_history: List[Dict[str, Any]] = []
+        self.executors: Dict[str, Tuple[Runner, Dict[str, Any]]] = {}
+        self.chains: Dict[Tuple[str, ...], Callable[[Any], Any]] = {}
+        self.history_names: Deque[str] = deque(maxlen=HISTORY_SIZE)
+        self.history_data: Deque[Any] = deque(maxlen=HISTORY_SIZE)
+        self.history_results: Deque[Any] = deque(maxlen=HISTORY_SIZE)
+        self.lock = threading.Lock()
+        self.pool: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def execution_history(self) -> List[Dict[str, Any]]:
+        '''
+        Return the last executions rebuilt from the history columns
+        '''
+        with self.lock:
+            return [
+                {'pipeline': name, 'data': data, 'result': result}
+                for (name, data, result) in zip(
+                    self.history_names, self.history_data,
+                    self.history_results
+                )
+            ]
+
+    def record_execution(self, name: str, data: Any, result: Any) -> None:
+        '''
+        Append one execution to the bounded history columns
+        '''
+        with self.lock:
+            self.history_names.append(name)
+            self.history_data.append(data)
+            self.history_results.append(result)
 
     def register_pipeline(
         self, name: str, pipeline: ProcessingPipeline
@@ -191,53 +500,121 @@ class NexusManager:
         '''
         Save a pipeline in the manager
         '''
-        if name in self.pipelines:
+        executor = (pipeline.run, pipeline.stats)
+        if self.executors.setdefault(name, executor) is not executor:
             print(name, "already register")
             return
         self.pipelines[name] = pipeline
+        self.chains.clear()
 
     def execute_pipeline(self, name: str, data: Any) -> Any:
         '''
         Execute a specific pipeline
         '''
-        if name not in self.pipelines:
+        executor = self.executors.get(name)
+        if executor is None:
             print(f"Pipeline {name} not found")
             return None
 
-        pipeline = self.pipelines[name]
-        result = pipeline.execute(data)
+        run, stats = executor
+        result, success = run(data)
 
-        self.execution_history.append({
-            'pipeline': name,
-            'data': data,
-            'result': result
-        })
+        with self.lock:
+            stats['success' if success else 'errors'] += 1
+            self.history_names.append(name)
+            self.history_data.append(data)
+            self.history_results.append(result)
 
         return result
 
+    def execute_batch(self, name: str, batch: List[Any]) -> Any:
+        '''
+        Execute a specific pipeline on a whole batch
+        '''
+        pipeline = self.pipelines.get(name)
+        if pipeline is None:
+            print(f"Pipeline {name} not found")
+            return None
+
+        results = pipeline.execute_batch(batch)
+
+        self.record_execution(name, batch, results)
+
+        return results
+
+    def get_pool(self) -> ThreadPoolExecutor:
+        '''
+        Return the worker pool, creating it on first use
+        '''
+        with self.lock:
+            if self.pool is None:
+                self.pool = ThreadPoolExecutor(
+                    max_workers=min(32, os.cpu_count() or 4)
+                )
+            return self.pool
+
+    def execute_many(self, jobs: List[Tuple[str, Any]]) -> List[Any]:
+        '''
+        Execute independent (name, data) jobs concurrently
+        '''
+        pool = self.get_pool()
+        futures = [pool.submit(self.execute_pipeline, name, data)
+                   for (name, data) in jobs]
+        return [future.result() for future in futures]
+
+    def chain_many(self, chains: List[Tuple[List[str], Any]]) -> List[Any]:
+        '''
+        Run independent pipeline chains concurrently
+        '''
+        pool = self.get_pool()
+        futures = [pool.submit(self.chain_pipelines, names, data)
+                   for (names, data) in chains]
+        return [future.result() for future in futures]
+
+    def shutdown(self) -> None:
+        '''
+        Stop the worker pool if it was started
+        '''
+        with self.lock:
+            pool, self.pool = self.pool, None
+        if pool is not None:
+            pool.shutdown()
+
     def chain_pipelines(self, pipeline_names: List[str], data: Any) -> Any:
         '''
         Chain many pipelines together output1 -> input2
         '''
-        current_data = data
+        key = tuple(pipeline_names)
+        chain = self.chains.get(key)
+        if chain is None:
+            chain = self.chains[key] = self.compile_chain(pipeline_names)
+        return chain(data)
+
+    def compile_chain(
+        self, pipeline_names: List[str]
+    ) -> Callable[[Any], Any]:
+        '''
+        Resolve the chained pipelines once and return a callable running them
+        '''
         chain_display = " -> ".join(pipeline_names)
         print(chain_display)
 
-        for name in pipeline_names:
-            if name in self.pipelines:
-                pipeline = self.pipelines[name]
-                current_data = pipeline.process(current_data)
+        steps = tuple(self.pipelines[name].process
+                      for name in pipeline_names if name in self.pipelines)
+
+        def chain(data: Any) -> Any:
+            for step in steps:
+                data = step(data)
+            return data
 
-        return current_data
+        return chain
 
-    def get_all_stats(self) -> Dict[str, Dict[str, Any]]:
+    def get_all_stats(self) -> Dict[str, Mapping[str, Any]]:
         '''
-        Return all the pipelines stats
+        Return all the pipelines stats as live read-only views
         '''
-        all_stats = {}
-        for name, pipeline in self.pipelines.items():
-            all_stats[name] = pipeline.get_stats()
-        return all_stats
+        return {name: pipeline.stats_view
+                for (name, pipeline) in self.pipelines.items()}
 
     def monitor_performance(self) -> Dict[str, Any]:
         '''
@@ -247,9 +624,9 @@ class NexusManager:
         total_errors = 0
 
         for pipeline in self.pipelines.values():
-            stats = pipeline.get_stats()
-            total_success += stats.get('success', 0)
-            total_errors += stats.get('errors', 0)
+            stats = pipeline.stats_view
+            total_success += stats['success']
+            total_errors += stats['errors']
 
         total_operations = total_success + total_errors
         efficiency = 0